@@ -1,33 +1,60 @@
+import atexit
 import logging
+import os
+import queue
 import time
+from logging.handlers import QueueHandler, QueueListener
 from flask import Flask, request, g
 from flask_restful import Api
 from flasgger import Swagger
 from waitress import serve
 from resources import HealthCheck, Transformations, TransformationToggle, Transform
+from resources.transform import MAX_REQUEST_SIZE
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
-)
+# Request threads only enqueue records; a background listener does the file/console I/O
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [logging.FileHandler('app.log'), logging.StreamHandler()]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+queue_handler = QueueHandler(queue.SimpleQueue())
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+log_listener = None
+
+
+def start_log_listener():
+    """Start the background thread draining the log queue into the real handlers.
+
+    Also runs in forked children (e.g. gunicorn workers with preload_app), since
+    the parent's listener thread does not survive the fork.
+    """
+    global log_listener
+    queue_handler.queue = queue.SimpleQueue()
+    log_listener = QueueListener(queue_handler.queue, *log_handlers, respect_handler_level=True)
+    log_listener.start()
+
+
+start_log_listener()
+os.register_at_fork(after_in_child=start_log_listener)
+atexit.register(lambda: log_listener.stop())
+
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
 app = Flask(__name__)
+# Reject oversized uploads while they are received, before they are spooled to disk
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_SIZE
 api = Api(app)
 swagger = Swagger(app)
 
 @app.before_request
 def before_request():
     g.start_time = time.time()
-    app.logger.info(f'Request: {request.method} {request.url} - IP: {request.remote_addr}')
+    app.logger.info('Request: %s %s - IP: %s', request.method, request.url, request.remote_addr)
 
 @app.after_request
 def after_request(response):
     duration = time.time() - g.start_time
-    app.logger.info(f'Response: {response.status_code} - Duration: {duration:.3f}s')
+    app.logger.info('Response: %s - Duration: %.3fs', response.status_code, duration)
     return response
 
 api.add_resource(HealthCheck, '/health')
@@ -37,6 +64,7 @@ api.add_resource(Transform, '/transform')
 
 
 if __name__ == '__main__':
+    # Development/Windows entry point; production runs gunicorn -c gunicorn.conf.py app:app
     logger = logging.getLogger('waitress')
     logger.setLevel(logging.INFO)
     
@@ -1,4 +1,8 @@
 from .registry import TransformationRegistry
-from .pipeline import DataTransformationPipeline
+from .pipeline import CompiledPlan, DataTransformationPipeline, Step
 
-__all__ = ['TransformationRegistry', 'DataTransformationPipeline']
\ No newline at end of file
+# Process-wide instances shared by every resource, so toggles apply to all endpoints
+REGISTRY = TransformationRegistry()
+PIPELINE = DataTransformationPipeline(REGISTRY)
+
+__all__ = ['TransformationRegistry', 'DataTransformationPipeline', 'CompiledPlan', 'Step', 'REGISTRY', 'PIPELINE']
\ No newline at end of file
@@ -4,8 +4,135 @@ This module provides a TransformationRegistry class that allows registration,
 enabling/disabling, and retrieval of data transformation functions for pandas DataFrames.
 """
 
+import functools
+import re
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Callable
+import pyarrow as pa
+from operator import eq, ne, gt, lt, ge, le
+from typing import Dict, Any, Callable, Optional, Set, Tuple, Union
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a 'contains' pattern once per distinct pattern.
+    
+    User patterns always use the stdlib re module, whose Unicode-aware \\d, \\w
+    and \\s classes match what pandas' str.contains matched before. RE2's are
+    ASCII-only, so using it when installed would make filters environment-dependent.
+    """
+    return re.compile(pattern)
+
+
+def _search(regex, strings: pd.Series) -> np.ndarray:
+    """Return a boolean array marking which strings contain a regex match."""
+    return np.fromiter((regex.search(string) is not None for string in strings),
+                       dtype=bool, count=len(strings))
+
+
+def _contains(series: pd.Series, value: Any) -> pd.Series:
+    """Vectorized substring match used by the 'contains' filter operator.
+    
+    The column is factorized so the pattern is matched once per distinct value
+    and broadcast back through the integer codes; enum-like columns with few
+    categories only scan a handful of strings instead of every row.
+    """
+    regex = _compile_pattern(str(value))
+    codes, uniques = pd.factorize(series)
+    category_matches = _search(regex, pd.Series(uniques).astype(str))
+    
+    # Missing values get code -1 and match as 'nan', their str() form in a float column
+    missing = codes == -1
+    mask = np.zeros(len(codes), dtype=bool)
+    mask[~missing] = category_matches[codes[~missing]]
+    if missing.any():
+        mask[missing] = regex.search('nan') is not None
+    return pd.Series(mask, index=series.index)
+
+
+_ARROW_STRING = pd.StringDtype('pyarrow')
+
+# Characters whose uppercase is several characters ('ß' -> 'SS'), all in the BMP. Arrow's
+# kernel maps each character to one ('ß' -> 'ẞ'), so values containing them use str.upper
+_MULTI_CHAR_UPPER_PATTERN = '[' + ''.join(re.escape(char) for char in map(chr, range(0x10000))
+                                          if len(char.upper()) > 1) + ']'
+
+
+def _is_ascii(strings: Union[pa.Array, pa.ChunkedArray]) -> bool:
+    """Check whether a string array is all ASCII by scanning its UTF-8 data buffers.
+    
+    Sliced arrays may share bytes of excluded values, which can only make the
+    check conservatively report non-ASCII.
+    """
+    chunks = strings.chunks if isinstance(strings, pa.ChunkedArray) else [strings]
+    for chunk in chunks:
+        data = chunk.buffers()[2]
+        if data is not None and np.frombuffer(data, dtype=np.uint8).max(initial=0) >= 0x80:
+            return False
+    return True
+
+
+def _str_upper(values: pd.Series) -> pd.Series:
+    """Uppercase Arrow-backed strings with Python's full case mapping.
+    
+    Arrow's C++ kernel does the work; in columns that are not all ASCII, only
+    values containing a character with a multi-character uppercase are redone
+    with str.upper, so results match pandas' object-string str.upper.
+    """
+    upper = values.str.upper()
+    if _is_ascii(pa.array(values.array)):
+        return upper
+    special = values.str.contains(_MULTI_CHAR_UPPER_PATTERN, regex=True, na=False).to_numpy(dtype=bool)
+    if special.any():
+        upper = upper.copy()
+        upper.iloc[np.flatnonzero(special)] = [value.upper() for value in values[special]]
+    return upper
+
+
+def _typed_scalar(value: Any, dtype: Any) -> Any:
+    """Cast a JSON filter value to a numeric column's scalar type when lossless.
+    
+    Matching scalar and array dtypes lets numpy use its typed comparison loops.
+    Values that would change under the cast (e.g. 25.5 against an int column,
+    or strings) are returned unchanged so comparison semantics are preserved.
+    """
+    if not isinstance(dtype, np.dtype) or isinstance(value, bool):
+        return value
+    if dtype.kind == 'i' and isinstance(value, int):
+        info = np.iinfo(dtype)
+        return dtype.type(value) if info.min <= value <= info.max else value
+    if dtype.kind == 'f' and isinstance(value, (int, float)):
+        typed = dtype.type(value)
+        return typed if typed == value else value
+    return value
+
+
+def _categorical_mask(op_func: Callable[[pd.Series, Any], pd.Series], column: pd.Series,
+                      value: Any) -> np.ndarray:
+    """Evaluate a filter operator once per category and gather the result by code.
+    
+    Besides scanning only the distinct values, this supports ordering operators,
+    which pandas rejects on unordered categoricals, so dictionary-encoded columns
+    filter exactly like plain string columns.
+    """
+    categories = pd.Series(column.cat.categories.to_numpy(dtype=object))
+    category_mask = op_func(categories, value).to_numpy(dtype=bool, na_value=False)
+    missing_match = op_func(pd.Series([None], dtype=object), value).to_numpy(dtype=bool, na_value=False)
+    
+    # Code -1 (missing) picks the trailing missing-value result
+    return np.append(category_mask, missing_match)[column.cat.codes.to_numpy()]
+
+
+# Filter operator dispatch table: operator symbol -> vectorized (series, value) -> mask
+_FILTER_OPS: Dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+    '==': eq,
+    '!=': ne,
+    '>': gt,
+    '<': lt,
+    '>=': ge,
+    '<=': le,
+    'contains': _contains,
+}
 
 
 class TransformationRegistry:
@@ -16,13 +143,19 @@ class TransformationRegistry:
     
     Attributes:
         _transformations: Dictionary mapping transformation names to functions
-        _enabled_transformations: Dictionary tracking which transformations are enabled
+        _enabled_set: Names of the currently enabled transformations
+        _available: Cached tuple of enabled names in registration order, or None when stale
+        _version: Counter bumped on every registration or enable/disable change
     """
     
+    FILTER_OPERATORS = frozenset(_FILTER_OPS)
+    
     def __init__(self):
         """Initialize the transformation registry with default transformations."""
         self._transformations: Dict[str, Callable] = {}
-        self._enabled_transformations: Dict[str, bool] = {}
+        self._enabled_set: Set[str] = set()
+        self._available: Optional[Tuple[str, ...]] = None
+        self._version = 0
         self._register_default_transformations()
     
     def register(self, name: str, func: Callable, enabled: bool = True):
@@ -30,11 +163,12 @@ class TransformationRegistry:
         
         Args:
             name: Unique name for the transformation
-            func: Callable that takes (df, config) and returns transformed DataFrame
+            func: Callable that takes (df, config) and returns a transformed DataFrame
+                  without modifying df in place
             enabled: Whether the transformation should be enabled by default
         """
         self._transformations[name] = func
-        self._enabled_transformations[name] = enabled
+        self._set_enabled(name, enabled)
     
     def enable(self, name: str, enabled: bool = True):
         """Enable or disable a registered transformation.
@@ -44,7 +178,36 @@ class TransformationRegistry:
             enabled: True to enable, False to disable
         """
         if name in self._transformations:
-            self._enabled_transformations[name] = enabled
+            self._set_enabled(name, enabled)
+    
+    def _set_enabled(self, name: str, enabled: bool):
+        """Record a transformation's enabled state and invalidate cached views."""
+        if enabled:
+            self._enabled_set.add(name)
+        else:
+            self._enabled_set.discard(name)
+        self._available = None
+        self._version += 1
+    
+    def is_enabled(self, name: str) -> bool:
+        """Check whether a transformation is registered and enabled.
+        
+        Args:
+            name: Name of the transformation to check
+            
+        Returns:
+            True if the transformation can currently be used
+        """
+        return name in self._enabled_set
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever a transformation is registered or toggled.
+        
+        Callers caching resolved transformation functions key on it so that
+        cached entries are not reused after the registry changes.
+        """
+        return self._version
     
     def get_transformation(self, name: str) -> Callable:
         """Get a transformation function by name.
@@ -60,17 +223,21 @@ class TransformationRegistry:
         """
         if name not in self._transformations:
             raise ValueError(f"Transformation '{name}' not found")
-        if not self._enabled_transformations.get(name, False):
+        if name not in self._enabled_set:
             raise ValueError(f"Transformation '{name}' is disabled")
         return self._transformations[name]
     
-    def get_available_transformations(self) -> List[str]:
-        """Get list of all enabled transformation names.
+    def get_available_transformations(self) -> Tuple[str, ...]:
+        """Get all enabled transformation names.
+        
+        The result is cached until a transformation is registered or toggled.
         
         Returns:
-            List of enabled transformation names
+            Tuple of enabled transformation names in registration order
         """
-        return [name for name, enabled in self._enabled_transformations.items() if enabled]
+        if self._available is None:
+            self._available = tuple(name for name in self._transformations if name in self._enabled_set)
+        return self._available
     
     def _register_default_transformations(self):
         """Register the default set of transformations."""
@@ -78,6 +245,32 @@ class TransformationRegistry:
         self.register('map_column', self._map_column)
         self.register('uppercase_column', self._uppercase_column)
     
+    @staticmethod
+    def _filter_mask(column: pd.Series, config: Dict[str, Any]) -> np.ndarray:
+        """Build the boolean row mask for a single filter predicate.
+        
+        Args:
+            column: Column the predicate is evaluated on
+            config: Configuration with 'operator' and 'value' keys
+                   
+        Returns:
+            Boolean array that is True for rows matching the predicate
+            
+        Raises:
+            ValueError: If operator is not supported
+        """
+        operator = config.get('operator', '==')
+        try:
+            op_func = _FILTER_OPS[operator]
+        except (KeyError, TypeError):
+            raise ValueError(f"Unsupported operator: {operator}")
+        
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            return _categorical_mask(op_func, column, config['value'])
+        
+        mask = op_func(column, _typed_scalar(config['value'], column.dtype))
+        return mask.to_numpy(dtype=bool, na_value=False)
+    
     @staticmethod
     def _filter_rows(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
         """Filter DataFrame rows based on column values.
@@ -93,26 +286,40 @@ class TransformationRegistry:
         Raises:
             ValueError: If operator is not supported
         """
-        column = config['column']
-        operator = config.get('operator', '==')
-        value = config['value']
-        
-        if operator == '==':
-            return df[df[column] == value]
-        elif operator == '!=':
-            return df[df[column] != value]
-        elif operator == '>':
-            return df[df[column] > value]
-        elif operator == '<':
-            return df[df[column] < value]
-        elif operator == '>=':
-            return df[df[column] >= value]
-        elif operator == '<=':
-            return df[df[column] <= value]
-        elif operator == 'contains':
-            return df[df[column].astype(str).str.contains(str(value), na=False)]
-        else:
-            raise ValueError(f"Unsupported operator: {operator}")
+        return df.iloc[TransformationRegistry._filter_mask(df[config['column']], config)]
+    
+    @staticmethod
+    def _filter_rows_fused(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
+        """Filter DataFrame rows matching all of several predicates in one pass.
+        
+        Not registered as a transformation: the pipeline substitutes it for runs
+        of consecutive filter_rows steps. The predicate masks are AND-ed into a
+        single boolean array so the frame is indexed once instead of being
+        copied once per predicate. Each referenced column is extracted once,
+        however many predicates use it.
+        
+        Args:
+            df: Input DataFrame to filter
+            config: Configuration with a 'predicates' key holding a list of
+                   filter_rows configurations
+                   
+        Returns:
+            Filtered DataFrame
+            
+        Raises:
+            ValueError: If any predicate uses an unsupported operator
+        """
+        columns: Dict[str, pd.Series] = {}
+        masks = []
+        for predicate in config['predicates']:
+            name = predicate['column']
+            if name not in columns:
+                columns[name] = df[name]
+            masks.append(TransformationRegistry._filter_mask(columns[name], predicate))
+        
+        if not masks:
+            return df
+        return df.iloc[np.logical_and.reduce(masks)]
     
     @staticmethod
     def _map_column(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
@@ -134,9 +341,8 @@ class TransformationRegistry:
         if old_name not in df.columns:
             raise ValueError(f"Column '{old_name}' not found in dataframe")
         
-        df_copy = df.copy()
-        df_copy = df_copy.rename(columns={old_name: new_name})
-        return df_copy
+        # rename returns a new frame; copy=False keeps the column data shared
+        return df.rename(columns={old_name: new_name}, copy=False)
     
     @staticmethod
     def _uppercase_column(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
@@ -147,7 +353,8 @@ class TransformationRegistry:
             config: Configuration with 'column' key specifying column to uppercase
                    
         Returns:
-            DataFrame with specified column values converted to uppercase
+            DataFrame with specified column values converted to uppercase as
+            Arrow-backed strings; missing values stay missing
             
         Raises:
             ValueError: If the specified column doesn't exist
@@ -157,6 +364,33 @@ class TransformationRegistry:
         if column not in df.columns:
             raise ValueError(f"Column '{column}' not found in dataframe")
         
-        df_copy = df.copy()
-        df_copy[column] = df_copy[column].astype(str).str.upper()
-        return df_copy
\ No newline at end of file
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            upper = TransformationRegistry._uppercase_categorical(values)
+        else:
+            # Arrow-backed strings upper-case in a C++ kernel instead of per Python object
+            if values.dtype != _ARROW_STRING:
+                values = values.astype(_ARROW_STRING)
+            upper = _str_upper(values)
+        
+        # Shallow copy: only the replaced column is newly allocated
+        df_copy = df.copy(deep=False)
+        df_copy[column] = upper
+        return df_copy
+    
+    @staticmethod
+    def _uppercase_categorical(values: pd.Series) -> pd.Series:
+        """Uppercase a categorical column by transforming only its categories.
+        
+        Categories that collide once uppercased (e.g. 'a' and 'A') are merged
+        and the codes remapped, so the per-row codes are never converted to strings.
+        """
+        categories = pd.Series(values.cat.categories.to_numpy(dtype=object)).astype(_ARROW_STRING)
+        new_index, new_categories = pd.factorize(_str_upper(categories))
+        
+        codes = values.cat.codes.to_numpy()
+        new_codes = np.full(len(codes), -1, dtype=codes.dtype)
+        present = codes >= 0
+        new_codes[present] = new_index[codes[present]]
+        return pd.Series(pd.Categorical.from_codes(new_codes, categories=new_categories),
+                         index=values.index, name=values.name)
\ No newline at end of file
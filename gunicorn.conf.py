@@ -0,0 +1,26 @@
+"""Gunicorn configuration for serving the Flask application.
+
+Run with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import multiprocessing
+import os
+
+bind = '0.0.0.0:5001'
+
+# One process per core so pandas/pyarrow work is not serialized by the GIL. Requests run
+# their pipeline on the worker thread itself: handing the frame to a separate process pool
+# costs more in pickling than the transformations take, and pool processes would hold their
+# own copy of the registry
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Import the app once in the master so the registry, pipeline and the heavy imports (pandas,
+# pyarrow and numba, ~1s together) are shared copy-on-write across workers.
+# Importing them lazily instead would repeat that cost in every worker after the fork.
+preload_app = True
+
+accesslog = '-'
+errorlog = '-'
+loglevel = 'info'
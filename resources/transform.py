@@ -1,14 +1,480 @@
-from flask import request
+from flask import Response, request
 from flask_restful import Resource
+from werkzeug.exceptions import RequestEntityTooLarge
+import fastjsonschema
+import numpy as np
+import orjson
 import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import contextlib
 import io
-import json
-import mimetypes
+import itertools
+import mmap
+import operator
 import os
-from common import TransformationRegistry, DataTransformationPipeline
+import re
+from tempfile import SpooledTemporaryFile
+from common import PIPELINE as pipeline, Step
 
-registry = TransformationRegistry()
-pipeline = DataTransformationPipeline(registry)
+try:
+    import re2
+except ImportError:  # google-re2 is a requirement, but uploads are still scanned window by window without it
+    re2 = None
+
+# Parse in 8MB blocks across the Arrow thread pool
+_CSV_READ_OPTIONS = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+# Smaller blocks when streaming so only ~1MB of unfiltered rows is held at a time
+_CSV_STREAM_READ_OPTIONS = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+# Empty cells and pandas' NA strings ('NA', 'None', '<NA>', ...) are missing values, as with
+# pandas.read_csv. Low-cardinality string columns are dictionary-encoded (pandas categoricals),
+# so string ops run per distinct value
+_CSV_NULL_VALUES = sorted(STR_NA_VALUES)
+_CSV_DICT_MAX_CARDINALITY = 1024
+_CSV_CONVERT_OPTIONS = pacsv.ConvertOptions(null_values=_CSV_NULL_VALUES, strings_can_be_null=True,
+                                            auto_dict_encode=True,
+                                            auto_dict_max_cardinality=_CSV_DICT_MAX_CARDINALITY)
+
+# String columns stay Arrow-backed in pandas instead of becoming one Python object per cell;
+# numeric columns convert to NumPy (zero-copy without nulls), dictionary columns to categoricals
+_ARROW_STRING = pd.StringDtype('pyarrow')
+_PANDAS_TYPES = {pa.string(): _ARROW_STRING, pa.large_string(): _ARROW_STRING}
+
+# Arrow parses integers beyond int64 as doubles; pandas keeps them exact (uint64 or text)
+_INT64_LIMIT = float(2 ** 63)
+
+# Accepted upload file extensions. The MIME type guessed from a .csv name is always
+# text/csv, and the client-sent one is not trustworthy, so no MIME check is made
+_CSV_EXTENSIONS = frozenset({'csv'})
+
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+# Request bodies beyond this are refused by Werkzeug while still being received (app
+# MAX_CONTENT_LENGTH); the slack covers the pipeline field and multipart framing
+MAX_REQUEST_SIZE = MAX_FILE_SIZE + (1 << 20)
+_FILE_TOO_LARGE_ERROR = f'File too large. Maximum size is {MAX_FILE_SIZE // (1024*1024)}MB'
+
+# Uploads this large are already spooled to disk by Werkzeug (>500KB) and are memory-mapped
+_MMAP_THRESHOLD = 1 << 20
+
+# JSON responses are serialized and sent this many rows at a time
+_JSON_CHUNK_ROWS = 10000
+
+ARROW_STREAM_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+# Basic malicious content patterns, matched case-insensitively
+_SUSPICIOUS_PATTERNS = [
+    b'<?php', b'<%', b'<script', b'eval(', b'exec(', b'system(', 
+    b'subprocess', b'import os', b'__import__', b'open('
+]
+_SCAN_WINDOW = 1 << 20
+
+
+def _compile_suspicious_scanner():
+    """Compile all suspicious patterns into one case-insensitive RE2 automaton.
+
+    RE2 matches a literal alternation with a DFA, so the upload is scanned once,
+    in place, for every pattern at the same time.
+
+    Returns:
+        Compiled RE2 pattern, or None when google-re2 is not installed
+    """
+    if re2 is None:
+        return None
+    
+    options = re2.Options()
+    options.case_sensitive = False
+    options.log_errors = False
+    # Latin-1 folds only ASCII letters onto the patterns, like bytes.lower() (UTF-8 would fold e.g. 'ſ' to 's')
+    options.encoding = re2.Options.Encoding.LATIN1
+    return re2.compile(b'|'.join(re.escape(pattern) for pattern in _SUSPICIOUS_PATTERNS), options=options)
+
+
+_SUSPICIOUS_SCANNER = _compile_suspicious_scanner()
+
+
+# Shape of a pipeline configuration, compiled once into a specialized validator function
+_MAX_PIPELINE_STEPS = 10
+_STEP_FIELDS = ('type', 'config')
+_STEP_FIELD_TYPES = (('type', str, 'a string'), ('config', dict, 'an object'))
+_PIPELINE_SCHEMA = {
+    'type': 'array',
+    'minItems': 1,
+    'maxItems': _MAX_PIPELINE_STEPS,
+    'items': {
+        'type': 'object',
+        'required': list(_STEP_FIELDS),
+        'additionalProperties': False,
+        'properties': {
+            'type': {'type': 'string'},
+            'config': {'type': 'object'},
+        },
+    },
+}
+_validate_pipeline = fastjsonschema.compile(_PIPELINE_SCHEMA)
+_step_fields = operator.itemgetter(*_STEP_FIELDS)
+
+
+def _pipeline_error_message(error, pipeline_config):
+    """Translate a pipeline schema violation into the API's error message.
+
+    Args:
+        error: JsonSchemaValueException raised by _validate_pipeline
+        pipeline_config: The pipeline that failed validation
+
+    Returns:
+        Error message naming the offending step, if any
+    """
+    if len(error.path) == 1:
+        return {
+            'type': 'Pipeline must be a list of transformation steps',
+            'minItems': 'Pipeline cannot be empty',
+            'maxItems': f'Pipeline cannot have more than {_MAX_PIPELINE_STEPS} steps',
+        }[error.rule]
+    
+    index = int(error.path[1])
+    return f'Step {index + 1}: {_step_error_message(pipeline_config[index])}'
+
+
+def _step_error_message(step):
+    """Describe an invalid step's first violation.
+
+    The schema validator may report a step's violations in any order, so the
+    step is re-checked field by field (type, then config, then extra fields)
+    to report the same violation as before it was used.
+    """
+    if not isinstance(step, dict):
+        return 'Each step must be an object'
+    for field, field_type, description in _STEP_FIELD_TYPES:
+        if field not in step:
+            return f'Missing required "{field}" field'
+        if not isinstance(step[field], field_type):
+            return f'"{field}" must be {description}'
+    unexpected = set(step) - set(_STEP_FIELDS)
+    return f'Unexpected fields: {", ".join(unexpected)}'
+
+
+def _value_type(field):
+    """Return a schema field's value type, looking through dictionary encoding."""
+    if pa.types.is_dictionary(field.type):
+        return field.type.value_type
+    return field.type
+
+
+def _on_disk(stream):
+    """Check whether an upload stream can be given to fileno() without forcing a rollover.
+
+    Werkzeug spools uploads into a SpooledTemporaryFile, which keeps uploads
+    up to 500KB in memory and only gets a name once it has rolled over to a
+    temporary file; calling its fileno() earlier would force that rollover.
+    """
+    return not isinstance(stream, SpooledTemporaryFile) or stream.name is not None
+
+
+def _upload_size(file):
+    """Return the uploaded file's size, with a single fstat once it is on disk.
+
+    Werkzeug rewinds the stream after spooling, so it is left at the start for reading.
+    """
+    stream = file.stream
+    if _on_disk(stream):
+        try:
+            return os.fstat(stream.fileno()).st_size
+        except (AttributeError, io.UnsupportedOperation, OSError):
+            pass
+    file.seek(0, os.SEEK_END)
+    file_size = file.tell()
+    file.seek(0)
+    return file_size
+
+
+def _dates_as_text(schema):
+    """Return the schema with its date32 columns typed as strings, if it has any.
+
+    Arrow only infers date32 from exact YYYY-MM-DD cells, so casting such a
+    column back to string reproduces the CSV text without re-parsing the file.
+
+    Returns:
+        Schema to cast the table to, or None if no column is a date32
+    """
+    if not any(pa.types.is_date32(field.type) for field in schema):
+        return None
+    return pa.schema([field.with_type(pa.string()) if pa.types.is_date32(field.type) else field
+                      for field in schema])
+
+
+def _needs_text_reread(field):
+    """Check whether a column was inferred as a time or timestamp, whose text does not round-trip."""
+    value_type = _value_type(field)
+    return pa.types.is_temporal(value_type) and not pa.types.is_date32(value_type)
+
+
+@contextlib.contextmanager
+def _upload_buffer(file, file_size):
+    """Yield the uploaded file's content as a bytes-like buffer, copying only small uploads.
+
+    Large uploads that Werkzeug has spooled to a temporary file are
+    memory-mapped read-only, so the kernel pages the CSV in on demand instead
+    of it being copied into a bytes object. Smaller uploads (kept in memory up
+    to 500KB) are read into bytes, a copy too small to be worth pooling
+    buffers across requests.
+    """
+    stream = file.stream
+    buffer = None
+    if file_size >= _MMAP_THRESHOLD and _on_disk(stream):
+        try:
+            buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, io.UnsupportedOperation, OSError, ValueError):
+            buffer = None
+    
+    if buffer is None:
+        yield stream.read()
+        return
+    
+    try:
+        yield buffer
+    finally:
+        try:
+            buffer.close()
+        except BufferError:
+            # Still exported (e.g. by a propagating exception's frames); closed on collection
+            pass
+
+
+def _contains_suspicious_content(csv_bytes):
+    """Check the raw upload for suspicious patterns, case-insensitively.
+
+    Without google-re2 the upload is lower-cased and searched one window at a time,
+    so the copy stays bounded at _SCAN_WINDOW bytes. A single re.IGNORECASE
+    alternation would avoid that copy but backtracks at every position, making
+    it several times slower than the per-pattern substring searches.
+    """
+    if _SUSPICIOUS_SCANNER is not None:
+        return _SUSPICIOUS_SCANNER.search(csv_bytes) is not None
+    
+    overlap = max(len(pattern) for pattern in _SUSPICIOUS_PATTERNS) - 1
+    for start in range(0, len(csv_bytes), _SCAN_WINDOW):
+        window = bytes(csv_bytes[max(0, start - overlap):start + _SCAN_WINDOW]).lower()
+        if any(pattern in window for pattern in _SUSPICIOUS_PATTERNS):
+            return True
+    return False
+
+
+def _differs_from_pandas(csv_bytes, schema):
+    """Check whether Arrow parses the CSV, with the inferred schema, differently from pandas.read_csv.
+
+    Arrow keeps duplicate and blank header names, which pandas renames to
+    'a.1' and 'Unnamed: 0'. It reads hex cells ('0x1F') as integers and signed
+    integers ('+5') as doubles, where pandas keeps text and integers, and
+    accepts a file ending inside an open quote, which pandas rejects. Those
+    are found from the raw bytes, only when they could have had an effect.
+    """
+    names = schema.names
+    if len(set(names)) < len(names) or '' in names:
+        return True
+    
+    value_types = [_value_type(field) for field in schema]
+    if any(pa.types.is_integer(value_type) for value_type in value_types):
+        # The single-byte search is a fast memchr; '0x' alone is slow as '0' is so common
+        for x in (b'x', b'X'):
+            if csv_bytes.find(x) != -1 and csv_bytes.find(b'0' + x) != -1:
+                return True
+    if any(pa.types.is_floating(value_type) for value_type in value_types):
+        if csv_bytes.find(b'+') != -1:
+            return True
+    
+    # Doubled quotes inside a quoted field come in pairs, so an odd count means an unclosed quote
+    if csv_bytes.find(b'"') != -1:
+        return np.count_nonzero(np.frombuffer(csv_bytes, dtype=np.uint8) == ord('"')) % 2 == 1
+    return False
+
+
+def _rounds_large_integers(table):
+    """Check whether Arrow parsed integers beyond int64 as doubles, which pandas keeps exact."""
+    return any(pa.types.is_floating(field.type) and pc.any(pc.greater_equal(pc.abs(column), _INT64_LIMIT)).as_py()
+               for field, column in zip(table.schema, table.columns))
+
+
+def _read_csv_pandas(csv_bytes):
+    """Parse CSV bytes with pandas.read_csv, for input the Arrow reader rejects or would change.
+
+    Raises:
+        pd.errors.EmptyDataError: If the input has no columns
+        pd.errors.ParserError: If pandas cannot parse the input either
+        UnicodeDecodeError: If the input is not valid UTF-8
+    """
+    return pd.read_csv(io.BytesIO(csv_bytes))
+
+
+def _read_csv(csv_bytes):
+    """Parse raw CSV bytes (or a memory map) into a DataFrame with the multithreaded Arrow reader.
+
+    Arrow infers date/time/timestamp columns where pandas keeps the raw text, so
+    such columns are turned back into strings to keep the output JSON-serializable:
+    dates by a cast, times and timestamps by re-reading the file with string columns.
+    UTF-8 is validated by the parser itself, in the same pass. Input Arrow rejects
+    (ragged rows, no header) or is known to parse differently (see
+    _differs_from_pandas) is handed to pandas, so it is accepted or reported
+    as before.
+    """
+    try:
+        table = pacsv.read_csv(pa.BufferReader(csv_bytes), read_options=_CSV_READ_OPTIONS,
+                               convert_options=_CSV_CONVERT_OPTIONS)
+        
+        if any(_needs_text_reread(field) for field in table.schema):
+            temporal_columns = [field.name for field in table.schema if pa.types.is_temporal(_value_type(field))]
+            convert_options = pacsv.ConvertOptions(null_values=_CSV_NULL_VALUES, strings_can_be_null=True,
+                                                   auto_dict_encode=True,
+                                                   auto_dict_max_cardinality=_CSV_DICT_MAX_CARDINALITY,
+                                                   column_types={name: pa.string() for name in temporal_columns})
+            table = pacsv.read_csv(pa.BufferReader(csv_bytes), read_options=_CSV_READ_OPTIONS,
+                                   convert_options=convert_options)
+        elif _dates_as_text(table.schema) is not None:
+            table = table.cast(_dates_as_text(table.schema))
+    except pa.ArrowInvalid:
+        return _read_csv_pandas(csv_bytes)
+    
+    # Arrow falls back to binary columns for bytes that are not valid UTF-8
+    if any(pa.types.is_binary(_value_type(field)) for field in table.schema):
+        raise UnicodeDecodeError('utf-8', b'', 0, 0, 'invalid UTF-8 data')
+    
+    if _differs_from_pandas(csv_bytes, table.schema) or _rounds_large_integers(table):
+        return _read_csv_pandas(csv_bytes)
+    
+    return table.to_pandas(self_destruct=True, split_blocks=True, types_mapper=_PANDAS_TYPES.get)
+
+
+def _read_csv_filtered(csv_bytes, filter_plan):
+    """Parse CSV bytes batch by batch, applying the compiled leading row filters to each batch.
+
+    Only rows surviving the filters are kept, so peak memory is one batch plus
+    the output rather than the whole parsed file. The streaming reader infers
+    column types from the first batch; input it cannot handle (later batches
+    that do not fit those types, time or timestamp columns, invalid UTF-8,
+    malformed rows, batches pandas would parse differently) is parsed in full
+    by _read_csv and filtered afterwards.
+
+    Returns:
+        Tuple of the unfiltered (rows, columns) shape and the filtered DataFrame
+    """
+    try:
+        reader = pacsv.open_csv(pa.BufferReader(csv_bytes), read_options=_CSV_STREAM_READ_OPTIONS,
+                                convert_options=_CSV_CONVERT_OPTIONS)
+        if not (any(_needs_text_reread(field) or pa.types.is_binary(_value_type(field)) for field in reader.schema)
+                or _differs_from_pandas(csv_bytes, reader.schema)):
+            text_schema = _dates_as_text(reader.schema)
+            row_count = 0
+            parts = []
+            for batch in reader:
+                row_count += batch.num_rows
+                batch_table = pa.Table.from_batches([batch])
+                if _rounds_large_integers(batch_table):
+                    break
+                if text_schema is not None:
+                    batch_table = batch_table.cast(text_schema)
+                parts.append(filter_plan(batch_table.to_pandas(split_blocks=True, types_mapper=_PANDAS_TYPES.get)))
+            else:
+                if not parts:
+                    empty_table = (text_schema or reader.schema).empty_table()
+                    return (0, len(reader.schema)), empty_table.to_pandas(types_mapper=_PANDAS_TYPES.get)
+                return (row_count, len(reader.schema)), pd.concat(parts, ignore_index=True, copy=False)
+    except pa.ArrowInvalid:
+        pass
+    
+    df = _read_csv(csv_bytes)
+    return df.shape, filter_plan(df)
+
+
+def _column_values(column):
+    """Convert a column to a list of JSON-native Python values in one vectorized call.
+
+    Missing values become None, or NaN for float columns (which orjson writes as null).
+    """
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+        return column.to_numpy().tolist()
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Code -1 (missing) picks the trailing None
+        categories = np.append(column.cat.categories.to_numpy(dtype=object), None)
+        return categories[column.cat.codes.to_numpy()].tolist()
+    return column.to_numpy(dtype=object, na_value=None).tolist()
+
+
+def _records(df):
+    """Build the row dicts of to_dict('records') column by column.
+
+    Each column is converted to Python values once, instead of pandas boxing
+    every cell through its per-row loop.
+    """
+    columns = df.columns.tolist()
+    values = [_column_values(column) for _, column in df.items()]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def _is_numeric_frame(df):
+    """Check whether every column is a NumPy integer, boolean or float64 column with a unique string name.
+
+    Other names (e.g. a column renamed to a number) are left to orjson's key conversion.
+    """
+    return df.columns.is_unique and all(isinstance(name, str) for name in df.columns) and all(
+        isinstance(dtype, np.dtype) and (dtype.kind in 'biu' or dtype == np.float64) for dtype in df.dtypes)
+
+
+def _numeric_records_json(df):
+    """Encode an all-numeric frame's records as a JSON array without building row dicts.
+
+    orjson encodes each NumPy column in C; splitting that array text at its
+    commas gives every cell's JSON, which is spliced into a per-row template.
+    The bytes match orjson.dumps(_records(df)).
+    """
+    template = b'{' + b','.join(orjson.dumps(name).replace(b'%', b'%%') + b':%b' for name in df.columns) + b'}'
+    values = [orjson.dumps(np.ascontiguousarray(column.to_numpy()), option=orjson.OPT_SERIALIZE_NUMPY)[1:-1].split(b',')
+              for _, column in df.items()]
+    return b'[' + b','.join([template % row for row in zip(*values)]) + b']'
+
+
+def _json_chunks(df, original_shape):
+    """Yield the JSON response body, serializing the records one chunk of rows at a time.
+
+    Only one chunk's row dicts and bytes are alive at any moment, instead of a
+    dict per result row plus the whole encoded body, and sending overlaps with
+    serializing the rest. The first piece holds the first chunk of rows, so
+    serialization errors surface before anything is sent.
+    """
+    shapes = orjson.dumps({'original_shape': list(original_shape), 'transformed_shape': list(df.shape)})
+    numeric = _is_numeric_frame(df)
+    prefix = shapes[:-1] + b',"data":['
+    for start in range(0, len(df), _JSON_CHUNK_ROWS):
+        chunk = df.iloc[start:start + _JSON_CHUNK_ROWS]
+        if numeric:
+            records = _numeric_records_json(chunk)
+        else:
+            # orjson encodes in C and writes NaN as null instead of invalid JSON; non-string
+            # column names (e.g. renamed to a number) become string keys, as with the json module
+            records = orjson.dumps(_records(chunk), option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        yield prefix + records[1:-1]
+        prefix = b','
+    yield (b']}' if prefix == b',' else prefix + b']}')
+
+
+def _arrow_stream_response(df, original_shape):
+    """Serialize a DataFrame as an Arrow IPC stream response.
+
+    The shapes reported by the JSON response are carried in the schema
+    metadata as 'original_shape' and 'transformed_shape' JSON arrays.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        b'original_shape': orjson.dumps(list(original_shape)),
+        b'transformed_shape': orjson.dumps(list(df.shape)),
+    })
+    
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return Response(sink.getvalue().to_pybytes(), mimetype=ARROW_STREAM_MIMETYPE)
 
 
 class Transform(Resource):
@@ -20,6 +486,9 @@ class Transform(Resource):
           - Transform
         consumes:
           - multipart/form-data
+        produces:
+          - application/json
+          - application/vnd.apache.arrow.stream
         parameters:
           - name: file
             in: formData
@@ -34,7 +503,10 @@ class Transform(Resource):
             example: '{"steps": [{"name": "normalize", "params": {}}]}'
         responses:
           200:
-            description: Data transformed successfully
+            description: >
+              Data transformed successfully. Clients preferring
+              application/vnd.apache.arrow.stream in their Accept header receive
+              the data as an Arrow IPC stream, with the shapes in its schema metadata.
             schema:
               type: object
               properties:
@@ -76,22 +548,14 @@ class Transform(Resource):
                 return {'error': 'No file selected'}, 400
             
             # File type validation
-            if not file.filename.lower().endswith('.csv'):
+            _, dot, extension = file.filename.rpartition('.')
+            if not dot or extension.lower() not in _CSV_EXTENSIONS:
                 return {'error': 'Only CSV files are supported'}, 400
             
-            # MIME type validation
-            mime_type, _ = mimetypes.guess_type(file.filename)
-            if mime_type and mime_type not in ['text/csv', 'text/plain', 'application/csv']:
-                return {'error': 'Invalid file type. Expected CSV format'}, 400
-            
-            # File size validation (10MB limit)
-            file.seek(0, os.SEEK_END)
-            file_size = file.tell()
-            file.seek(0)
-            
-            MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+            # File size validation (10MB limit); oversized requests never get this far
+            file_size = _upload_size(file)
             if file_size > MAX_FILE_SIZE:
-                return {'error': f'File too large. Maximum size is {MAX_FILE_SIZE // (1024*1024)}MB'}, 400
+                return {'error': _FILE_TOO_LARGE_ERROR}, 400
             
             if file_size == 0:
                 return {'error': 'Empty file provided'}, 400
@@ -101,8 +565,8 @@ class Transform(Resource):
                 return {'error': 'No pipeline configuration provided'}, 400
             
             try:
-                pipeline_config = json.loads(pipeline_config_str)
-            except json.JSONDecodeError:
+                pipeline_config = orjson.loads(pipeline_config_str)
+            except orjson.JSONDecodeError:
                 return {'error': 'Invalid JSON in pipeline configuration'}, 400
             
             # Handle both old and new pipeline formats
@@ -111,92 +575,70 @@ class Transform(Resource):
                 steps = pipeline_config['steps']
                 if not isinstance(steps, list):
                     return {'error': 'Pipeline steps must be a list'}, 400
-                # Convert to new format
-                pipeline_config = []
-                for step in steps:
-                    if not isinstance(step, dict):
-                        return {'error': 'Each step must be an object'}, 400
-                    if 'name' not in step:
-                        return {'error': 'Step missing required "name" field'}, 400
-                    pipeline_config.append({
-                        'type': step['name'],
-                        'config': step.get('params', {})
-                    })
+                # Convert to new format; indexing a non-object JSON value raises TypeError
+                try:
+                    pipeline_config = [{'type': step['name'], 'config': step.get('params', {})} for step in steps]
+                except TypeError:
+                    return {'error': 'Each step must be an object'}, 400
+                except KeyError:
+                    return {'error': 'Step missing required "name" field'}, 400
             
             # Validate pipeline structure
-            if not isinstance(pipeline_config, list):
-                return {'error': 'Pipeline must be a list of transformation steps'}, 400
+            try:
+                _validate_pipeline(pipeline_config)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return {'error': _pipeline_error_message(e, pipeline_config)}, 400
             
-            if len(pipeline_config) == 0:
-                return {'error': 'Pipeline cannot be empty'}, 400
+            steps = [Step(*_step_fields(step)) for step in pipeline_config]
             
-            if len(pipeline_config) > 10:
-                return {'error': 'Pipeline cannot have more than 10 steps'}, 400
+            # Leading row filters run per batch while parsing; the rest runs on the survivors
+            filter_steps, remaining_steps = pipeline.split_filter_prefix(steps)
             
-            # Validate each transformation step
-            for i, step in enumerate(pipeline_config):
-                if not isinstance(step, dict):
-                    return {'error': f'Step {i+1}: Each step must be an object'}, 400
-                
-                if 'type' not in step:
-                    return {'error': f'Step {i+1}: Missing required "type" field'}, 400
-                
-                if not isinstance(step['type'], str):
-                    return {'error': f'Step {i+1}: "type" must be a string'}, 400
-                
-                if 'config' not in step:
-                    return {'error': f'Step {i+1}: Missing required "config" field'}, 400
-                
-                if not isinstance(step['config'], dict):
-                    return {'error': f'Step {i+1}: "config" must be an object'}, 400
-                
-                # Check for unexpected fields
-                allowed_fields = {'type', 'config'}
-                unexpected = set(step.keys()) - allowed_fields
-                if unexpected:
-                    return {'error': f'Step {i+1}: Unexpected fields: {", ".join(unexpected)}'}, 400
-            
-            # Read and validate CSV content
-            csv_content = file.read().decode('utf-8')
-            
-            # Basic malicious content scanning
-            suspicious_patterns = [
-                '<?php', '<%', '<script', 'eval(', 'exec(', 'system(', 
-                'subprocess', 'import os', '__import__', 'open('
-            ]
-            
-            content_lower = csv_content.lower()
-            for pattern in suspicious_patterns:
-                if pattern in content_lower:
-                    return {'error': 'File contains potentially malicious content'}, 400
+            # Resolve both plans before touching the upload, so unknown or disabled
+            # transformations are reported without scanning and parsing the CSV first
+            filter_plan = pipeline.compile(filter_steps) if filter_steps else None
+            plan = pipeline.compile(remaining_steps)
             
-            # Validate CSV structure
-            try:
-                df = pd.read_csv(io.StringIO(csv_content))
-            except pd.errors.EmptyDataError:
-                return {'error': 'CSV file is empty or has no valid data'}, 400
-            except pd.errors.ParserError as e:
-                return {'error': f'Invalid CSV format: {str(e)}'}, 400
-            except UnicodeDecodeError:
-                return {'error': 'File encoding is not valid UTF-8'}, 400
+            # Read and validate CSV content (raw bytes, decoded by the CSV parser)
+            with _upload_buffer(file, file_size) as csv_bytes:
+                # Basic malicious content scanning
+                if _contains_suspicious_content(csv_bytes):
+                    return {'error': 'File contains potentially malicious content'}, 400
+                
+                # Validate CSV structure
+                try:
+                    if filter_plan is not None:
+                        original_shape, df = _read_csv_filtered(csv_bytes, filter_plan)
+                    else:
+                        df = _read_csv(csv_bytes)
+                        original_shape = df.shape
+                except pd.errors.EmptyDataError:
+                    return {'error': 'CSV file is empty or has no valid data'}, 400
+                except pd.errors.ParserError as e:
+                    return {'error': f'Invalid CSV format: {str(e)}'}, 400
+                except UnicodeDecodeError:
+                    return {'error': 'File encoding is not valid UTF-8'}, 400
             
             # Validate CSV has data
-            if df.empty:
+            if 0 in original_shape:
                 return {'error': 'CSV file contains no data rows'}, 400
             
             # Validate reasonable column count (prevent memory exhaustion)
-            if len(df.columns) > 100:
+            if original_shape[1] > 100:
                 return {'error': 'CSV file has too many columns (max 100)'}, 400
             
-            transformed_df = pipeline.process(df, pipeline_config)
+            transformed_df = plan(df)
             
-            result = {
-                'original_shape': list(df.shape),
-                'transformed_shape': list(transformed_df.shape),
-                'data': transformed_df.to_dict('records')
-            }
+            # Columnar clients get Arrow IPC and skip per-row JSON encoding entirely
+            if request.accept_mimetypes.best_match(['application/json', ARROW_STREAM_MIMETYPE]) == ARROW_STREAM_MIMETYPE:
+                return _arrow_stream_response(transformed_df, original_shape)
             
-            return result
+            body = _json_chunks(transformed_df, original_shape)
+            first_chunk = next(body)
+            return Response(itertools.chain([first_chunk], body), mimetype='application/json')
         
+        except RequestEntityTooLarge:
+            # Raised while parsing the form once the body exceeds MAX_CONTENT_LENGTH
+            return {'error': _FILE_TOO_LARGE_ERROR}, 400
         except Exception as e:
             return {'error': str(e)}, 500
\ No newline at end of file
@@ -1,8 +1,6 @@
 from flask import request
 from flask_restful import Resource
-from common import TransformationRegistry
-
-registry = TransformationRegistry()
+from common import REGISTRY as registry
 
 
 class Transformations(Resource):
@@ -1,5 +1,6 @@
 import pytest
 from app import app
+from common import REGISTRY
 
 
 @pytest.fixture
@@ -10,6 +11,15 @@ def client():
         yield client
 
 
+@pytest.fixture(autouse=True)
+def restore_registry():
+    """Restore the shared registry's enabled transformations after each test."""
+    enabled = REGISTRY.get_available_transformations()
+    yield
+    for name in set(enabled) ^ set(REGISTRY.get_available_transformations()):
+        REGISTRY.enable(name, name in enabled)
+
+
 @pytest.fixture
 def sample_csv_content():
     """Sample CSV content for testing."""
@@ -3,6 +3,11 @@
 import pytest
 import json
 import io
+import pandas as pd
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor
+from common import PIPELINE, TransformationRegistry
+from common import pipeline as pipeline_module
 
 
 class TestTransformEndpoint:
@@ -31,6 +36,14 @@ class TestTransformEndpoint:
         data = response.get_json()
         assert data['error'] == 'Only CSV files are supported'
 
+    def test_transform_csv_name_without_extension(self, client):
+        """Test that a file named just 'csv' is not taken for a CSV file."""
+        data = {'file': (io.BytesIO(b'test content'), 'csv')}
+        response = client.post('/transform', data=data)
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['error'] == 'Only CSV files are supported'
+
     def test_transform_missing_pipeline(self, client, sample_csv_content):
         """Test transform request without pipeline configuration."""
         data = {'file': (io.BytesIO(sample_csv_content.encode()), 'test.csv')}
@@ -129,10 +142,665 @@ class TestTransformEndpoint:
         assert 'transformed_shape' in data
         assert 'data' in data
 
+    def test_transform_invalid_pipeline_structure(self, client, sample_csv_content):
+        """Test that pipeline schema violations name the offending step."""
+        cases = [
+            ([], 'Pipeline cannot be empty'),
+            ({"type": "filter_rows"}, 'Pipeline must be a list of transformation steps'),
+            ([{"type": "uppercase_column"}], 'Step 1: Missing required "config" field'),
+            ([{"type": "uppercase_column", "config": {}}, {"type": 1, "config": {}}], 'Step 2: "type" must be a string'),
+            ([{"type": "uppercase_column", "config": {}, "extra": 1}], 'Step 1: Unexpected fields: extra'),
+            # Steps with several violations report the first in type, config, extra-field order
+            ([{"type": 1}], 'Step 1: "type" must be a string'),
+            ([{"config": [], "extra": 1}], 'Step 1: Missing required "type" field'),
+            ([{"type": "uppercase_column", "config": 1, "extra": 1}], 'Step 1: "config" must be an object'),
+            (["uppercase_column"], 'Step 1: Each step must be an object'),
+        ]
+        for pipeline_config, error in cases:
+            data = {
+                'file': (io.BytesIO(sample_csv_content.encode()), 'test.csv'),
+                'pipeline': json.dumps(pipeline_config)
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 400
+            assert response.get_json()['error'] == error
+    
+    def test_transform_file_too_large(self, client):
+        """Test that uploads over the size limit are rejected."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        for size in (10 * 1024 * 1024 + 1, 12 * 1024 * 1024):
+            data = {
+                'file': (io.BytesIO(b"name\n" + b"x" * size), 'test.csv'),
+                'pipeline': pipeline_config
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 400
+            assert response.get_json()['error'] == 'File too large. Maximum size is 10MB'
+    
+    def test_transform_unknown_transformation_reported_before_parsing(self, client):
+        """Test that an unknown transformation is reported even when the CSV is invalid."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "name", "operator": "==", "value": "x"}},
+            {"type": "normalize", "config": {}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"name,age\n\xff\xfe,30"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 500
+        assert response.get_json()['error'] == "Transformation 'normalize' not found"
+    
+    def test_transform_invalid_legacy_pipeline_steps(self, client, sample_csv_content):
+        """Test validation of the legacy {"steps": [...]} pipeline format."""
+        cases = [
+            ({"steps": "uppercase_column"}, 'Pipeline steps must be a list'),
+            ({"steps": [["uppercase_column"]]}, 'Each step must be an object'),
+            ({"steps": [{"name": "uppercase_column", "params": {"column": "name"}}, "x"]}, 'Each step must be an object'),
+            ({"steps": [{"params": {}}]}, 'Step missing required "name" field'),
+        ]
+        for pipeline_config, error in cases:
+            data = {
+                'file': (io.BytesIO(sample_csv_content.encode()), 'test.csv'),
+                'pipeline': json.dumps(pipeline_config)
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 400
+            assert response.get_json()['error'] == error
+    
     def test_transform_method_not_allowed(self, client):
         """Test that only POST requests are allowed on the transform endpoint."""
         response = client.get('/transform')
         assert response.status_code == 405
         
         response = client.put('/transform')
-        assert response.status_code == 405
\ No newline at end of file
+        assert response.status_code == 405
+
+    def test_transform_date_column_kept_as_string(self, client):
+        """Test that date-like columns are returned unchanged as strings."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"name,joined\nJohn,2020-01-01\nJane,2021-06-15"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data'][0] == {'name': 'JOHN', 'joined': '2020-01-01'}
+
+    def test_transform_date_and_time_columns_kept_as_strings(self, client):
+        """Test that dates, times and timestamps come back as their original text."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "joined", "operator": ">", "value": "2020-06-01"}}
+        ])
+        
+        csv_content = b"name,joined,shift,seen\nJohn,2020-01-01,09:00,2021-01-01 10:00\nJane,2021-06-15,17:30,2021-02-01T08:15:00Z\nBob,,,"
+        data = {
+            'file': (io.BytesIO(csv_content), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data'] == [{'name': 'Jane', 'joined': '2021-06-15', 'shift': '17:30', 'seen': '2021-02-01T08:15:00Z'}]
+    
+    def test_transform_invalid_utf8(self, client):
+        """Test transform request with a CSV that is not valid UTF-8."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"name,age\n\xff\xfe,30"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['error'] == 'File encoding is not valid UTF-8'
+
+    def test_transform_malformed_csv(self, client):
+        """Test transform request with rows that do not match the header."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"name,age\nJohn,30\nJane,25,extra"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['error'].startswith('Invalid CSV format')
+    
+    def test_transform_blank_and_header_only_csv(self, client):
+        """Test that blank and header-only files get the empty CSV errors."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "a"}}
+        ])
+        
+        cases = [
+            (b"\n\n", 'CSV file is empty or has no valid data'),
+            (b"a,b", 'CSV file contains no data rows'),
+        ]
+        for csv_content, error in cases:
+            data = {
+                'file': (io.BytesIO(csv_content), 'test.csv'),
+                'pipeline': pipeline_config
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 400
+            assert response.get_json()['error'] == error
+    
+    def test_transform_short_rows_filled_with_null(self, client):
+        """Test that rows with missing trailing fields are padded with nulls."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"name,age,city\nJohn,30,Boston\nJane,25"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data'] == [
+            {'name': 'JOHN', 'age': 30, 'city': 'Boston'},
+            {'name': 'JANE', 'age': 25, 'city': None}
+        ]
+    
+    def test_transform_duplicate_headers_renamed(self, client):
+        """Test that duplicate column names are deduplicated as by pandas."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "a.1", "operator": ">", "value": 2}},
+            {"type": "uppercase_column", "config": {"column": "a"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"a,a,b\nx,1,2\ny,3,4"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data'] == [{'a': 'Y', 'a.1': 3, 'b': 4}]
+    
+    def test_transform_integers_beyond_int64_kept_exact(self, client):
+        """Test that integers too large for int64 are not rounded through float."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "id", "operator": "!=", "value": 0}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"id,big\n12345678901234567891,-99999999999999999999\n2,3"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data'] == [
+            {'id': 12345678901234567891, 'big': '-99999999999999999999'},
+            {'id': 2, 'big': '3'}
+        ]
+
+    def test_transform_hex_cells_kept_as_text(self, client):
+        """Test that hexadecimal-looking cells are not converted to integers."""
+        csv_content = b"code,n\n0x1F,1\n0xff,2"
+        # A leading filter parses in batches; a rename parses the whole file first
+        for pipeline_config in (
+            [{"type": "filter_rows", "config": {"column": "n", "operator": ">", "value": 0}}],
+            [{"type": "map_column", "config": {"old_name": "n", "new_name": "n"}}]
+        ):
+            data = {
+                'file': (io.BytesIO(csv_content), 'test.csv'),
+                'pipeline': json.dumps(pipeline_config)
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 200
+            assert response.get_json()['data'] == [{'code': '0x1F', 'n': 1}, {'code': '0xff', 'n': 2}]
+    
+    def test_transform_pandas_na_strings_are_missing(self, client):
+        """Test that cells such as 'None' and '<NA>' are read as missing values."""
+        csv_content = b"name,n\nNone,1\n<NA>,2\nx,3"
+        # A leading filter parses in batches; a rename parses the whole file first
+        for pipeline_config in (
+            [{"type": "filter_rows", "config": {"column": "n", "operator": ">", "value": 0}}],
+            [{"type": "map_column", "config": {"old_name": "n", "new_name": "n"}}]
+        ):
+            data = {
+                'file': (io.BytesIO(csv_content), 'test.csv'),
+                'pipeline': json.dumps(pipeline_config)
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 200
+            assert response.get_json()['data'] == [
+                {'name': None, 'n': 1}, {'name': None, 'n': 2}, {'name': 'x', 'n': 3}
+            ]
+        
+        data = {
+            'file': (io.BytesIO(csv_content), 'test.csv'),
+            'pipeline': json.dumps([{"type": "filter_rows", "config": {"column": "name", "operator": "==", "value": "None"}}])
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        assert response.get_json()['transformed_shape'] == [0, 2]
+    
+    def test_transform_blank_header_named_unnamed(self, client):
+        """Test that a blank header cell is named like pandas does."""
+        csv_content = b",n\nx,1\ny,2"
+        # A leading filter parses in batches; a rename parses the whole file first
+        for pipeline_config in (
+            [{"type": "filter_rows", "config": {"column": "n", "operator": ">", "value": 0}}],
+            [{"type": "map_column", "config": {"old_name": "n", "new_name": "n"}}]
+        ):
+            data = {
+                'file': (io.BytesIO(csv_content), 'test.csv'),
+                'pipeline': json.dumps(pipeline_config)
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 200
+            assert response.get_json()['data'] == [{'Unnamed: 0': 'x', 'n': 1}, {'Unnamed: 0': 'y', 'n': 2}]
+    
+    def test_transform_unterminated_quote_rejected(self, client):
+        """Test that a file ending inside an open quote is reported as invalid CSV."""
+        csv_content = b'name,n\nx,1\ny,"2'
+        # A leading filter parses in batches; a rename parses the whole file first
+        for pipeline_config in (
+            [{"type": "filter_rows", "config": {"column": "n", "operator": ">", "value": 0}}],
+            [{"type": "map_column", "config": {"old_name": "n", "new_name": "n"}}]
+        ):
+            data = {
+                'file': (io.BytesIO(csv_content), 'test.csv'),
+                'pipeline': json.dumps(pipeline_config)
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 400
+            assert response.get_json()['error'].startswith('Invalid CSV format')
+    
+    def test_transform_signed_integers_stay_integers(self, client):
+        """Test that integers written with a leading '+' are read as integers."""
+        csv_content = b"v,n\n+5,1\n-3,2"
+        # A leading filter parses in batches; a rename parses the whole file first
+        for pipeline_config in (
+            [{"type": "filter_rows", "config": {"column": "n", "operator": ">", "value": 0}}],
+            [{"type": "map_column", "config": {"old_name": "n", "new_name": "n"}}]
+        ):
+            data = {
+                'file': (io.BytesIO(csv_content), 'test.csv'),
+                'pipeline': json.dumps(pipeline_config)
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 200
+            rows = response.get_json()['data']
+            assert rows == [{'v': 5, 'n': 1}, {'v': -3, 'n': 2}]
+            assert all(type(row['v']) is int for row in rows)
+    
+    def test_transform_multiple_filters(self, client):
+        """Test that consecutive filter steps keep only rows matching all of them."""
+        csv_content = "name,age,city\nJohn,30,Boston\nJane,25,Boston\nBob,35,Chicago\nAlice,28,Boston"
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "age", "operator": ">", "value": 26}},
+            {"type": "filter_rows", "config": {"column": "city", "operator": "==", "value": "Boston"}},
+            {"type": "filter_rows", "config": {"column": "name", "operator": "contains", "value": "o"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(csv_content.encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['transformed_shape'] == [1, 3]
+        assert data['data'] == [{'name': 'John', 'age': 30, 'city': 'Boston'}]
+
+    def test_transform_many_numeric_filters_match_unfused(self, client):
+        """Test that a long run of numeric filters (JIT-compiled with numba) matches filtering step by step."""
+        rows = "\n".join(f"{i},{i % 7},{(i * 3) % 11 + 0.5},{'' if i % 13 == 0 else i % 5}" for i in range(500))
+        csv_content = ("id,a,b,c\n" + rows).encode()
+        filters = [
+            {"column": "a", "operator": ">=", "value": 2},
+            {"column": "b", "operator": "<", "value": 9.5},
+            {"column": "c", "operator": "!=", "value": 3},
+            {"column": "id", "operator": ">", "value": 10},
+            {"column": "a", "operator": "!=", "value": 5}
+        ]
+        
+        expected = pd.read_csv(io.BytesIO(csv_content))
+        for config in filters:
+            expected = TransformationRegistry._filter_rows(expected, config)
+        
+        data = {
+            'file': (io.BytesIO(csv_content), 'test.csv'),
+            'pipeline': json.dumps([{"type": "filter_rows", "config": config} for config in filters])
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        assert [row['id'] for row in response.get_json()['data']] == expected['id'].tolist()
+        assert tuple(config['operator'] for config in filters) in pipeline_module._jit_kernels
+        
+        # Worker threads call the same compiled plan concurrently
+        plan = PIPELINE.compile([{"type": "filter_rows", "config": config} for config in filters])
+        df = pd.read_csv(io.BytesIO(csv_content))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: plan(df), range(32)))
+        assert all(result['id'].tolist() == expected['id'].tolist() for result in results)
+    
+    def test_transform_multiple_filters_missing_column(self, client, sample_csv_content):
+        """Test that a filter on a missing column still fails after fusion."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "age", "operator": ">", "value": 20}},
+            {"type": "filter_rows", "config": {"column": "missing", "operator": "==", "value": 1}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(sample_csv_content.encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 500
+        assert 'error' in response.get_json()
+
+    def test_transform_missing_values_serialized_as_null(self, client):
+        """Test that missing CSV values are returned as JSON null."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "name", "operator": "!=", "value": "Bob"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"name,score\nJohn,1.5\nJane,"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        data = response.get_json()
+        assert data['data'] == [{'name': 'John', 'score': 1.5}, {'name': 'Jane', 'score': None}]
+
+    def test_transform_mixed_column_types_serialized(self, client):
+        """Test JSON output for integer, float, boolean, string and missing values."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "id", "operator": ">", "value": 0}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"id,score,active,name\n1,0.5,true,John\n2,,false,\n3,1.25,,Bob"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data'] == [
+            {'id': 1, 'score': 0.5, 'active': True, 'name': 'John'},
+            {'id': 2, 'score': None, 'active': False, 'name': None},
+            {'id': 3, 'score': 1.25, 'active': None, 'name': 'Bob'},
+        ]
+    
+    def test_transform_non_string_column_name(self, client, sample_csv_content):
+        """Test that a column renamed to a number is returned under a string key."""
+        pipeline_config = json.dumps([
+            {"type": "map_column", "config": {"old_name": "age", "new_name": 5}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(sample_csv_content.encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data'][0] == {'name': 'John', '5': 30, 'salary': 50000}
+    
+    def test_transform_numeric_only_output(self, client):
+        """Test records of an all-numeric result spanning several response chunks."""
+        rows = "\n".join(f"{i},{'' if i % 1000 == 0 else i / 4},{i % 2}" for i in range(25000))
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "flag", "operator": "==", "value": 1}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(f"id,score,flag\n{rows}".encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['transformed_shape'] == [12500, 3]
+        assert data['data'][0] == {'id': 1, 'score': 0.25, 'flag': 1}
+        assert data['data'][-1] == {'id': 24999, 'score': 6249.75, 'flag': 1}
+        assert all(row['id'] == 2 * n + 1 for n, row in enumerate(data['data']))
+    
+    def test_transform_numeric_only_output_non_string_column_name(self, client):
+        """Test that an all-numeric result with a column renamed to a number is valid JSON."""
+        pipeline_config = json.dumps([
+            {"type": "map_column", "config": {"old_name": "a", "new_name": 5}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"a,b\n1,2\n3,4.5"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        assert json.loads(response.data)['data'] == [{'5': 1, 'b': 2.0}, {'5': 3, 'b': 4.5}]
+    
+    def test_transform_uppercase_keeps_missing_values(self, client):
+        """Test that uppercasing leaves missing values as null."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "city"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO("name,city\nJohn,münchen\nJane,".encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data'] == [{'name': 'John', 'city': 'MÜNCHEN'}, {'name': 'Jane', 'city': None}]
+
+    def test_transform_ordering_filter_on_repeated_strings(self, client):
+        """Test ordering operators on low-cardinality (dictionary-encoded) string columns."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "city", "operator": ">", "value": "LA"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"name,city\nJohn,NYC\nJane,LA\nBob,SF\nAmy,\nTom,NYC"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [row['name'] for row in data['data']] == ['John', 'Bob', 'Tom']
+    
+    def test_transform_uppercase_full_case_mapping(self, client):
+        """Test that characters with multi-character uppercase forms uppercase like str.upper."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        # Few distinct values are dictionary-encoded; thousands stay plain strings
+        for row_count in (3, 3000):
+            rows = "\n".join(f"{i},{['straße', 'ﬁx', 'plain'][i % 3]}{i}" for i in range(row_count))
+            data = {
+                'file': (io.BytesIO(f"id,name\n{rows}".encode()), 'test.csv'),
+                'pipeline': pipeline_config
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 200
+            names = [row['name'] for row in response.get_json()['data']]
+            assert names[:3] == ['STRASSE0', 'FIX1', 'PLAIN2']
+    
+    def test_transform_uppercase_merges_case_variants(self, client):
+        """Test that uppercasing a repeated-string column merges values differing only in case."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "city"}},
+            {"type": "filter_rows", "config": {"column": "city", "operator": "==", "value": "NYC"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"name,city\nJohn,nyc\nJane,NYC\nBob,sf\nAmy,Nyc"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [row['name'] for row in data['data']] == ['John', 'Jane', 'Amy']
+
+    def test_transform_contains_unicode_character_classes(self, client):
+        """Test that 'contains' character classes match non-ASCII letters and digits."""
+        csv_content = "name,code\ncafé,١٢٣\ncafe,abc\ntea,123".encode()
+        cases = [
+            ({"column": "name", "operator": "contains", "value": "^caf\\w$"}, ['café', 'cafe']),
+            ({"column": "code", "operator": "contains", "value": "^\\d+$"}, ['café', 'tea']),
+        ]
+        for config, names in cases:
+            data = {
+                'file': (io.BytesIO(csv_content), 'test.csv'),
+                'pipeline': json.dumps([{"type": "filter_rows", "config": config}])
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 200
+            assert [row['name'] for row in response.get_json()['data']] == names
+    
+    def test_transform_contains_on_high_cardinality_strings(self, client):
+        """Test 'contains' and uppercase on a string column too varied for dictionary encoding."""
+        rows = "\n".join(f"{i},{'' if i % 10 == 0 else f'user{i}'}" for i in range(2000))
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "name", "operator": "contains", "value": "99"}},
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(f"id,name\n{rows}".encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        expected = [i for i in range(2000) if '99' in str(i) and i % 10 != 0]
+        assert [row['id'] for row in data['data']] == expected
+        assert all(row['name'] == f"USER{row['id']}" for row in data['data'])
+
+    def test_transform_filters_large_csv_in_batches(self, client):
+        """Test that leading filters over a multi-batch CSV match a single-pass result."""
+        rows = ''.join(f"user{i},{i % 100},{'Boston' if i % 3 == 0 else 'Chicago'}\n" for i in range(80000))
+        csv_content = "name,age,city\n" + rows
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "age", "operator": ">=", "value": 95}},
+            {"type": "filter_rows", "config": {"column": "city", "operator": "==", "value": "Boston"}},
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(csv_content.encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        expected = [i for i in range(80000) if i % 100 >= 95 and i % 3 == 0]
+        assert data['original_shape'] == [80000, 3]
+        assert data['transformed_shape'] == [len(expected), 3]
+        assert [row['name'] for row in data['data']] == [f'USER{i}' for i in expected]
+
+    def test_transform_filters_large_csv_with_late_type_change(self, client):
+        """Test filtering when a column's type only changes in a later part of the file."""
+        rows = ''.join(f"{i},{i % 10}\n" for i in range(200000)) + "200000,0.5\n"
+        csv_content = "id,score\n" + rows
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "score", "operator": "<", "value": 1}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(csv_content.encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['original_shape'] == [200001, 2]
+        assert data['transformed_shape'] == [20001, 2]
+        assert data['data'][-1] == {'id': 200000, 'score': 0.5}
+
+    def test_transform_large_csv_with_malicious_content(self, client):
+        """Test that suspicious content is detected anywhere in a large upload."""
+        rows = ''.join(f"user{i},{i % 100}\n" for i in range(150000))
+        csv_content = "name,age\n" + rows + "<SCRIPT>alert(1)</script>,1\n"
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(csv_content.encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['error'] == 'File contains potentially malicious content'
+
+    def test_transform_uploads_in_memory_and_on_disk(self, client):
+        """Test uploads kept in memory, spooled to disk, and large enough to be memory-mapped."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "age", "operator": "==", "value": 7}}
+        ])
+        
+        # ~10KB stays in memory; ~700KB is on disk but read; ~2MB is memory-mapped
+        for row_count in (1000, 60000, 180000):
+            rows = ''.join(f"user{i},{i % 100}\n" for i in range(row_count))
+            data = {
+                'file': (io.BytesIO(("name,age\n" + rows).encode()), 'test.csv'),
+                'pipeline': pipeline_config
+            }
+            response = client.post('/transform', data=data)
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data['original_shape'] == [row_count, 2]
+            assert data['transformed_shape'] == [row_count // 100, 2]
+    
+    def test_transform_malicious_content_without_re2(self, client, monkeypatch):
+        """Test the windowed fallback scan used when google-re2 is not installed."""
+        monkeypatch.setattr('resources.transform._SUSPICIOUS_SCANNER', None)
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(b"name,age\nJohn,25\n<?PHP echo 1; ?>,30"), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data)
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'File contains potentially malicious content'
+
+    def test_transform_arrow_stream_response(self, client, sample_csv_content):
+        """Test that clients accepting Arrow IPC receive an Arrow stream."""
+        pipeline_config = json.dumps([
+            {"type": "filter_rows", "config": {"column": "age", "operator": ">", "value": 25}},
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        data = {
+            'file': (io.BytesIO(sample_csv_content.encode()), 'test.csv'),
+            'pipeline': pipeline_config
+        }
+        response = client.post('/transform', data=data,
+                               headers={'Accept': 'application/vnd.apache.arrow.stream'})
+        assert response.status_code == 200
+        assert response.mimetype == 'application/vnd.apache.arrow.stream'
+        
+        table = pa.ipc.open_stream(response.data).read_all()
+        assert table.to_pylist() == [{'name': 'JOHN', 'age': 30, 'salary': 50000}]
+        assert json.loads(table.schema.metadata[b'original_shape']) == [2, 3]
+        assert json.loads(table.schema.metadata[b'transformed_shape']) == [1, 3]
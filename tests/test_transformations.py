@@ -1,6 +1,8 @@
 """Tests for the transformations endpoints."""
 
 import pytest
+import json
+import io
 
 
 class TestTransformationsEndpoint:
@@ -14,6 +16,12 @@ class TestTransformationsEndpoint:
         assert 'available_transformations' in data
         assert isinstance(data['available_transformations'], list)
 
+    def test_internal_fused_filter_not_listed(self, client):
+        """Test that the fused filter used internally is not a public transformation."""
+        response = client.get('/transformations')
+        assert response.status_code == 200
+        assert 'filter_rows_fused' not in response.get_json()['available_transformations']
+
     def test_transformations_method_not_allowed(self, client):
         """Test that only GET requests are allowed on the transformations endpoint."""
         response = client.post('/transformations')
@@ -43,6 +51,24 @@ class TestTransformationToggleEndpoint:
         assert 'filter_rows' in data['message']
         assert 'disabled' in data['message']
 
+    def test_disabled_transformation_rejected_by_transform(self, client):
+        """Test that disabling a transformation applies to the transform endpoint."""
+        pipeline_config = json.dumps([
+            {"type": "uppercase_column", "config": {"column": "name"}}
+        ])
+        
+        client.post('/transformations/uppercase_column/enable', json={'enabled': False})
+        try:
+            response = client.post('/transform', data={
+                'file': (io.BytesIO(b"name,age\nJohn,30"), 'test.csv'),
+                'pipeline': pipeline_config
+            })
+        finally:
+            client.post('/transformations/uppercase_column/enable', json={'enabled': True})
+        
+        assert response.status_code == 500
+        assert response.get_json()['error'] == "Transformation 'uppercase_column' is disabled"
+
     def test_toggle_with_default_enabled_value(self, client):
         """Test that enabled defaults to True when not specified."""
         response = client.post('/transformations/filter_rows/enable',